@@ -6,6 +6,7 @@ Airflow DAG for orchestrating Tumblr data pipeline
 from airflow import DAG
 from airflow.providers.standard.operators.python import PythonOperator
 from datetime import datetime, timedelta
+import pandas as pd
 import sys
 import os
 
@@ -15,11 +16,11 @@ sys.path.insert(0, os.path.join(airflow_home, 'dags'))
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 try:
-    from src.scraper import TumblrScraper
+    from src.scraper import TumblrScraper, AsyncTumblrScraper
     from src.cleaner import DataCleaner
     from src.loader import DataLoader
 except ImportError:
-    from scraper import TumblrScraper
+    from scraper import TumblrScraper, AsyncTumblrScraper
     from cleaner import DataCleaner
     from loader import DataLoader
 
@@ -45,51 +46,76 @@ dag = DAG(
 )
 
 
-def scrape_tumblr_data(**context):
-    """Task 1: Scrape data from Tumblr"""
-    print("Starting Tumblr scraping...")
+BLOGS_TO_SCRAPE = [
+    'https://staff.tumblr.com/',
+    'https://engineering.tumblr.com/',
+    'https://www.tumblr.com/tagged/photography',
+    'https://www.tumblr.com/tagged/art',
+    'https://www.tumblr.com/tagged/coding',
+    'https://www.tumblr.com/tagged/technology',
+]
+
+
+def scrape_one_blog(url, **context):
+    """Task 1: Scrape a single Tumblr blog (mapped once per blog)"""
+    print(f"Starting Tumblr scraping for {url}...")
     
-    blogs_to_scrape = [
-        'https://staff.tumblr.com/',
-        'https://engineering.tumblr.com/',
-        'https://www.tumblr.com/tagged/photography',
-        'https://www.tumblr.com/tagged/art',
-        'https://www.tumblr.com/tagged/coding',
-        'https://www.tumblr.com/tagged/technology',
-    ]
-    scraper = TumblrScraper(headless=True)
+    map_index = context['task_instance'].map_index
+    filename = f'tumblr_posts_{map_index}'
+    output_file = f'data/{filename}.csv'
     
-    try:
-        scraper.scrape_multiple_blogs(blogs_to_scrape, posts_per_blog=4)
-        
-        scraper.save_data('tumblr_posts', format='csv')
-        
-        output_file = 'data/tumblr_posts.csv'
-        print(f"Scraping completed. Data saved to {output_file}")
-        
-        context['task_instance'].xcom_push(key='raw_data_file', value=output_file)
-        
-        return output_file
-        
-    except Exception as e:
-        print(f"Error during scraping: {e}")
-        raise
+    # drop output left over from a previous run so an empty scrape is not masked
+    if os.path.exists(output_file):
+        os.remove(output_file)
     
-    finally:
-        scraper.close()
+    fast_scraper = AsyncTumblrScraper()
+    needs_browser = fast_scraper.scrape_multiple_blogs([url])
+    
+    if needs_browser:
+        scraper = TumblrScraper(headless=True)
+        try:
+            scraper.scrape_multiple_blogs(needs_browser, posts_per_blog=4, max_workers=1)
+            scraper.save_data(filename, format='csv')
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+            raise
+        finally:
+            scraper.close()
+    else:
+        fast_scraper.save_data(filename, format='csv')
+    
+    if not os.path.exists(output_file):
+        print(f"No posts scraped from {url}")
+        return None
+    
+    print(f"Scraping completed. Data saved to {output_file}")
+    
+    context['task_instance'].xcom_push(key='raw_data_file', value=output_file)
+    
+    return output_file
 
 
 def clean_tumblr_data(**context):
     """Task 2: Clean and process scraped data"""
     print("Starting data cleaning...")
     
-    raw_data_file = context['task_instance'].xcom_pull(
+    # map_indexes must be explicit: it defaults to this task's own index (-1),
+    # which matches none of the mapped scrape tasks
+    raw_files = context['task_instance'].xcom_pull(
         task_ids='scrape_data', 
-        key='raw_data_file'
+        key='raw_data_file',
+        map_indexes=range(len(BLOGS_TO_SCRAPE))
     )
+    if isinstance(raw_files, str):
+        raw_files = [raw_files]
+    raw_files = [f for f in (raw_files or []) if f and os.path.exists(f)]
     
-    if not raw_data_file:
-        raw_data_file = 'data/tumblr_posts.csv'
+    if not raw_files:
+        raise FileNotFoundError("No per-blog scrape output found from scrape_data tasks")
+    
+    # merge the per-blog outputs of the mapped scrape tasks
+    raw_data_file = 'data/tumblr_posts.csv'
+    pd.concat([pd.read_csv(f) for f in raw_files], ignore_index=True).to_csv(raw_data_file, index=False)
     
     cleaner = DataCleaner(input_file=raw_data_file)
     
@@ -181,11 +207,13 @@ def validate_pipeline(**context):
 
 
 #taskss
-scrape_task = PythonOperator(
+# one mapped task per blog; scrape_pool caps how many browsers run at once
+scrape_task = PythonOperator.partial(
     task_id='scrape_data',
-    python_callable=scrape_tumblr_data,
+    python_callable=scrape_one_blog,
+    pool='scrape_pool',
     dag=dag,
-)
+).expand(op_kwargs=[{'url': url} for url in BLOGS_TO_SCRAPE])
 
 clean_task = PythonOperator(
     task_id='clean_data',
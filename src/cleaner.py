@@ -1,8 +1,36 @@
 import pandas as pd
 import re
+import ast
 import os
 from datetime import datetime
 import numpy as np
+import orjson
+
+
+_WS_RE = re.compile(r'\s+')
+_URL_OR_JUNK = re.compile(r'https?://\S+|[^\w\s.,!?;:\'-]')
+
+
+def _clean_one(text):
+    """Strip urls and junk characters, then collapse whitespace"""
+    return _WS_RE.sub(' ', _URL_OR_JUNK.sub('', text)).strip()
+
+
+def parse_tags(tags_str):
+    """Parse a raw tags cell into a list of tags"""
+    if not isinstance(tags_str, str) or tags_str == '[]':
+        return []
+    if tags_str.startswith('['):
+        try:
+            tags = orjson.loads(tags_str)
+        except orjson.JSONDecodeError:
+            # older scrapes stored the Python repr of the list
+            try:
+                tags = ast.literal_eval(tags_str)
+            except (ValueError, SyntaxError):
+                return []
+        return [str(tag) for tag in tags] if isinstance(tags, list) else []
+    return [t.strip() for t in tags_str.split(',')]
 
 
 class DataCleaner:
@@ -14,22 +42,28 @@ class DataCleaner:
     def load_data(self):
         """Load raw data from CSV"""
         print(f"Loading data from {self.input_file}")
-        self.df = pd.read_csv(self.input_file)
+        # C parser: raw post_text keeps line breaks, which pandas' pyarrow engine
+        # cannot parse; timestamp stays text so the ISO format is preserved
+        self.df = pd.read_csv(
+            self.input_file,
+            usecols=['timestamp', 'post_text', 'post_type', 'notes_count', 'tags', 'image_url', 'post_url'],
+            dtype={'timestamp': str}
+        )
         print(f"Loaded {len(self.df)} records")
         return self.df
     
     def remove_duplicates(self):
         """Remove duplicate posts based on post_url"""
         initial_count = len(self.df)
-        self.df = self.df.drop_duplicates(subset=['post_url'], keep='first')
+        self.df = self.df.drop_duplicates(subset=['post_url'], keep='first', ignore_index=True)
         removed = initial_count - len(self.df)
         print(f"Removed {removed} duplicate records")
         
     def remove_empty_posts(self):
         """Remove posts with no text content"""
         initial_count = len(self.df)
-        self.df = self.df[self.df['post_text'].notna()]
-        self.df = self.df[self.df['post_text'].str.len() > 0]
+        mask = self.df['post_text'].notna() & (self.df['post_text'].str.len() > 0)
+        self.df = self.df.loc[mask].reset_index(drop=True)
         removed = initial_count - len(self.df)
         print(f"Removed {removed} empty posts")
     
@@ -38,19 +72,10 @@ class DataCleaner:
         print("Cleaning text content...")
         
         #removing white spacess
-        self.df['post_text'] = self.df['post_text'].str.strip()
-        self.df['post_text'] = self.df['post_text'].str.replace(r'\s+', ' ', regex=True)
-        
-        self.df['post_text_clean'] = self.df['post_text'].apply(
-            lambda x: re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', str(x))
-        )
-        
-        self.df['post_text_clean'] = self.df['post_text_clean'].apply(
-            lambda x: re.sub(r'[^\w\s.,!?;:\'-]', '', str(x))
-        )
+        self.df['post_text'] = self.df['post_text'].str.strip().str.replace(_WS_RE, ' ', regex=True)
         
-        self.df['post_text_clean'] = self.df['post_text_clean'].str.strip()
-        self.df['post_text_clean'] = self.df['post_text_clean'].str.replace(r'\s+', ' ', regex=True)
+        arr = self.df['post_text'].fillna('').to_numpy()
+        self.df['post_text_clean'] = [_clean_one(x) for x in arr]
         
     def handle_missing_values(self):
         """Handle missing values in the dataset"""
@@ -67,50 +92,26 @@ class DataCleaner:
         """Add new features derived from existing data"""
         print("Adding derived features...")
         
-        self.df['word_count'] = self.df['post_text'].apply(lambda x: len(str(x).split()))
+        self.df['word_count'] = self.df['post_text'].str.count(r'\S+').fillna(0).astype('int32')
         
-        self.df['char_count'] = self.df['post_text'].apply(lambda x: len(str(x)))
+        self.df['char_count'] = self.df['post_text'].str.len().fillna(0).astype('int32')
         
-        self.df['has_image'] = self.df['image_url'].apply(lambda x: 1 if len(str(x)) > 0 else 0)
+        self.df['has_image'] = (self.df['image_url'].fillna('').str.len() > 0).astype('int8')
         
-        def count_tags(tags_str):
-            try:
-                if pd.isna(tags_str) or tags_str == '[]':
-                    return 0
-                if isinstance(tags_str, str) and tags_str.startswith('['):
-                    tags = eval(tags_str)
-                    return len(tags) if isinstance(tags, list) else 0
-                return 0
-            except:
-                return 0
-        
-        self.df['tag_count'] = self.df['tags'].apply(count_tags)
-        
-        def tags_to_string(tags_str):
-            try:
-                if pd.isna(tags_str) or tags_str == '[]':
-                    return ''
-                if isinstance(tags_str, str) and tags_str.startswith('['):
-                    tags = eval(tags_str)
-                    if isinstance(tags, list):
-                        return ', '.join(str(tag) for tag in tags)
-                return ''
-            except:
-                return ''
-        
-        self.df['tags_str'] = self.df['tags'].apply(tags_to_string)
-        
-        def categorize_engagement(notes):
-            if notes == 0:
-                return 'no_engagement'
-            elif notes < 10:
-                return 'low'
-            elif notes < 100:
-                return 'medium'
-            else:
-                return 'high'
-        
-        self.df['engagement_level'] = self.df['notes_count'].apply(categorize_engagement)
+        # tags are parsed once and reused by the loader
+        parsed = [parse_tags(v) for v in self.df['tags'].to_numpy()]
+        self.df['tags_parsed'] = parsed
+        
+        self.df['tag_count'] = np.fromiter((len(x) for x in parsed), dtype=np.int32, count=len(parsed))
+        
+        self.df['tags_str'] = [', '.join(x) for x in parsed]
+        
+        # integer bins: 0 -> none, 1-9 -> low, 10-99 -> medium, 100+ -> high
+        self.df['engagement_level'] = pd.cut(
+            self.df['notes_count'].astype('int64'),
+            bins=[-1, 0, 9, 99, np.inf],
+            labels=['no_engagement', 'low', 'medium', 'high']
+        ).astype('category')
         
         self.df['scrape_date'] = pd.to_datetime(self.df['timestamp']).dt.date
         
@@ -118,10 +119,11 @@ class DataCleaner:
         """Filter posts based on quality criteria"""
         initial_count = len(self.df)
         
-        self.df = self.df[
-            (self.df['word_count'] >= min_word_count) & 
-            (self.df['word_count'] <= max_word_count)
-        ]
+        # numexpr evaluates both bounds in a single pass over word_count
+        self.df = self.df.query(
+            '@min_word_count <= word_count <= @max_word_count',
+            engine='numexpr'
+        ).reset_index(drop=True)
         
         removed = initial_count - len(self.df)
         print(f"Removed {removed} posts outside word count range ({min_word_count}-{max_word_count})")
@@ -130,8 +132,6 @@ class DataCleaner:
         """Standardize post type categories"""
         print("Standardizing post types...")
         
-        self.df['post_type'] = self.df['post_type'].str.lower()
-        
         type_mapping = {
             'image': 'photo',
             'picture': 'photo',
@@ -140,7 +140,9 @@ class DataCleaner:
             'quotation': 'quote'
         }
         
-        self.df['post_type'] = self.df['post_type'].replace(type_mapping)
+        # on a category the mapping runs once per distinct type, not per row
+        post_type = self.df['post_type'].astype('string').str.lower().astype('category')
+        self.df['post_type'] = post_type.map(lambda t: type_mapping.get(t, t)).astype('category')
     
     def clean_all(self, min_records=100):
         """Execute all cleaning steps"""
@@ -159,6 +161,8 @@ class DataCleaner:
         
         print("\nStep 4: Cleaning text")
         self.clean_text()
+        # post_text is final here; arrow strings give C-level len/count for the derived features
+        self.df['post_text'] = self.df['post_text'].astype('string[pyarrow]')
         
         print("\nStep 5: Standardizing post types")
         self.standardize_post_types()
@@ -180,7 +184,8 @@ class DataCleaner:
         """Save cleaned data to CSV"""
         os.makedirs('data', exist_ok=True)
         
-        self.df.to_csv(output_file, index=False)
+        # the parsed list column would only round-trip as a string
+        self.df.drop(columns=['tags_parsed']).to_csv(output_file, index=False)
         print(f"\nCleaned data saved to {output_file}")
         
         self.print_summary()
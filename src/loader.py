@@ -3,6 +3,11 @@ import sqlite3
 import os
 from datetime import datetime
 
+try:
+    from src.cleaner import parse_tags
+except ImportError:
+    from cleaner import parse_tags
+
 
 class DataLoader:
     def __init__(self, db_path='data/output.db'):
@@ -13,12 +18,29 @@ class DataLoader:
     def connect(self):
         """Connect to SQLite database"""
         os.makedirs('data', exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
+        # autocommit mode: transactions are opened explicitly with BEGIN
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None)
+        for pragma in (
+            "locking_mode=EXCLUSIVE",
+            "journal_mode=WAL",
+            "synchronous=OFF",
+            "temp_store=MEMORY",
+            "cache_size=-200000",
+            "mmap_size=268435456",
+        ):
+            self.conn.execute(f"PRAGMA {pragma}")
         print(f"Connected to database: {self.db_path}")
         
     def create_tables(self):
         """Create database tables"""
         cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
+        
+        # posts written by the old to_sql(if_exists='replace') load has no id or
+        # UNIQUE post_url; it is rebuilt here since load_posts reloads it in full
+        posts_columns = [row[1] for row in cursor.execute("PRAGMA table_info(posts)")]
+        if posts_columns and 'id' not in posts_columns:
+            cursor.execute("DROP TABLE posts")
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS posts (
@@ -56,6 +78,7 @@ class DataLoader:
                 PRIMARY KEY (post_id, tag_id)
             )
         ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_post_tags_tag ON post_tags(tag_id)")
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS summary_statistics (
@@ -72,12 +95,9 @@ class DataLoader:
         self.conn.commit()
         print("Database tables created successfully")
     
-    def load_posts(self, csv_file='data/cleaned_tumblr_data.csv'):
+    def load_posts(self, csv_file='data/cleaned_tumblr_data.csv', chunksize=200_000):
         """Load posts from CSV into database"""
         print(f"\nLoading data from {csv_file}")
-        df = pd.read_csv(csv_file)
-        
-        print(f"Loading {len(df)} posts into database...")
         
         posts_columns = [
             'post_url', 'post_text', 'post_text_clean', 'post_type',
@@ -85,16 +105,45 @@ class DataLoader:
             'image_url', 'tag_count', 'tags_str', 'engagement_level',
             'scrape_date', 'timestamp'
         ]
+        # only these columns are kept in memory for the tag and summary steps
+        keep_columns = ['post_url', 'tags', 'post_type', 'notes_count', 'word_count', 'has_image']
+        
+        # to_sql(if_exists='replace') would drop the id/UNIQUE schema from create_tables
+        insert_sql = (
+            f"INSERT INTO posts ({', '.join(posts_columns)}) "
+            f"VALUES ({', '.join('?' * len(posts_columns))})"
+        )
+        
+        # the pyarrow engine cannot stream, so chunks come from the C parser;
+        # the wide text columns are held at most chunksize rows at a time,
+        # while the slim keep_columns frame still grows with the file
+        chunks = pd.read_csv(
+            csv_file,
+            usecols=posts_columns + ['tags'],
+            dtype={
+                'notes_count': 'int64',
+                'word_count': 'int32',
+                'char_count': 'int32',
+                'has_image': 'int8',
+                'tag_count': 'int32',
+                'scrape_date': str,
+                'timestamp': str,
+            },
+            chunksize=chunksize
+        )
         
-        for col in posts_columns:
-            if col not in df.columns:
-                df[col] = None
-        
-        posts_df = df[posts_columns]
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
+        cursor.execute("DELETE FROM posts")
+        kept = []
+        for chunk in chunks:
+            cursor.executemany(insert_sql, chunk[posts_columns].itertuples(index=False, name=None))
+            kept.append(chunk[keep_columns])
+        self.conn.commit()
         
-        posts_df.to_sql('posts', self.conn, if_exists='replace', index=False)
+        df = pd.concat(kept, ignore_index=True) if kept else pd.DataFrame(columns=keep_columns)
         
-        print(f"✓ Loaded {len(posts_df)} posts")
+        print(f"✓ Loaded {len(df)} posts")
         
         return df
     
@@ -102,91 +151,55 @@ class DataLoader:
         """Extract and load tags into normalized tables"""
         print("\nLoading tags...")
         
+        if 'tags_parsed' not in df.columns:
+            df['tags_parsed'] = [parse_tags(v) for v in df['tags'].to_numpy()]
+        
         cursor = self.conn.cursor()
+        post_id_by_url = dict(cursor.execute("SELECT post_url, id FROM posts").fetchall())
+        
+        unique_tags = set()
+        pairs = []
+        for post_url, tags in df[['post_url', 'tags_parsed']].itertuples(index=False):
+            if post_url not in post_id_by_url:
+                continue
+            for tag in tags:
+                tag = tag.strip().lower()
+                if tag:
+                    unique_tags.add(tag)
+                    pairs.append((post_url, tag))
+        
+        # one transaction for the whole tag load instead of autocommit per row
+        cursor.execute("BEGIN")
         cursor.execute("DELETE FROM post_tags")
         cursor.execute("DELETE FROM tags")
-        
-        tag_id_map = {}
-        tag_counter = 1
-        
-        for idx, row in df.iterrows():
-            if pd.notna(row['tags']) and row['tags'] != '[]':
-                try:
-                    if isinstance(row['tags'], str):
-                        if row['tags'].startswith('['):
-                            tags = eval(row['tags'])
-                        else:
-                            tags = [t.strip() for t in row['tags'].split(',')]
-                    else:
-                        tags = []
-                    
-                    cursor.execute("SELECT id FROM posts WHERE post_url = ?", (row['post_url'],))
-                    result = cursor.fetchone()
-                    if not result:
-                        continue
-                    post_id = result[0]
-                    for tag in tags:
-                        if tag and tag.strip():
-                            tag = tag.strip().lower()
-                            
-                            if tag not in tag_id_map:
-                                cursor.execute("INSERT OR IGNORE INTO tags (tag_name) VALUES (?)", (tag,))
-                                cursor.execute("SELECT id FROM tags WHERE tag_name = ?", (tag,))
-                                tag_id = cursor.fetchone()[0]
-                                tag_id_map[tag] = tag_id
-                            else:
-                                tag_id = tag_id_map[tag]
-                            
-                            cursor.execute(
-                                "INSERT OR IGNORE INTO post_tags (post_id, tag_id) VALUES (?, ?)",
-                                (post_id, tag_id)
-                            )
-                
-                except Exception as e:
-                    print(f"Error processing tags for post {idx}: {e}")
-                    continue
-        
+        cursor.executemany(
+            "INSERT OR IGNORE INTO tags (tag_name) VALUES (?)",
+            [(tag,) for tag in unique_tags]
+        )
+        tag_id_map = dict(cursor.execute("SELECT tag_name, id FROM tags").fetchall())
+        cursor.executemany(
+            "INSERT OR IGNORE INTO post_tags (post_id, tag_id) VALUES (?, ?)",
+            [(post_id_by_url[url], tag_id_map[tag]) for url, tag in pairs]
+        )
         self.conn.commit()
         
         cursor.execute("SELECT COUNT(*) FROM tags")
         tag_count = cursor.fetchone()[0]
         print(f"✓ Loaded {tag_count} unique tags")
     
-    def generate_summary_statistics(self):
-        """Generate and store summary statistics"""
+    def generate_summary_statistics(self, stats):
+        """Store summary statistics computed from the loaded posts"""
         print("\nGenerating summary statistics...")
         
         cursor = self.conn.cursor()
-        
-        
-        cursor.execute("SELECT COUNT(*) FROM posts")
-        total_posts = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT AVG(word_count) FROM posts")
-        avg_word_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT AVG(notes_count) FROM posts")
-        avg_notes = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT SUM(has_image) FROM posts")
-        posts_with_images = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT post_type, COUNT(*) as count 
-            FROM posts 
-            GROUP BY post_type 
-            ORDER BY count DESC 
-            LIMIT 1
-        """)
-        result = cursor.fetchone()
-        most_common_type = result[0] if result else 'unknown'
-        
-        
         cursor.execute("""
             INSERT INTO summary_statistics 
             (total_posts, avg_word_count, avg_notes, posts_with_images, most_common_type)
             VALUES (?, ?, ?, ?, ?)
-        """, (total_posts, avg_word_count, avg_notes, posts_with_images, most_common_type))
+        """, (
+            stats['total_posts'], stats['avg_word_count'], stats['avg_notes'],
+            stats['posts_with_images'], stats['most_common_type']
+        ))
         
         self.conn.commit()
         print("✓ Summary statistics generated")
@@ -239,7 +252,17 @@ class DataLoader:
         
         df = self.load_posts(csv_file)
         self.load_tags(df)
-        self.generate_summary_statistics()
+        
+        # computed from the frame already in memory instead of re-scanning posts
+        post_type_mode = df['post_type'].mode()
+        stats = {
+            'total_posts': len(df),
+            'avg_word_count': float(df['word_count'].mean()),
+            'avg_notes': float(df['notes_count'].mean()),
+            'posts_with_images': int(df['has_image'].sum()),
+            'most_common_type': post_type_mode.iat[0] if not post_type_mode.empty else 'unknown',
+        }
+        self.generate_summary_statistics(stats)
         
         self.verify_data()
         
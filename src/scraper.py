@@ -4,32 +4,75 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import httpx
+import asyncio
 import pandas as pd
-import time
 import json
 from datetime import datetime
 import os
 
-class TumblrScraper:
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+POST_SELECTOR = "article, div[class*='post'], .post"
+
+
+class BaseScraper:
+    def __init__(self):
+        """Initialize the collected posts"""
+        self.data = []
+    
+    def save_data(self, filename='tumblr_data', format='both'):
+        """Save the collected data to the data folder"""
+        os.makedirs('data', exist_ok=True)
+        df = pd.DataFrame(self.data)
+        
+        if df.empty:
+            print("No data to save")
+            return
+        
+        if format in ['csv', 'both']:
+            # tags go into the CSV as JSON so the cleaner can parse them with orjson
+            csv_df = df.assign(tags=[json.dumps(tags, ensure_ascii=False) for tags in df['tags']])
+            csv_df.to_csv(f'data/{filename}.csv', index=False)
+            print(f"Data saved to data/{filename}.csv")
+        
+        if format in ['json', 'both']:
+            df.to_json(f'data/{filename}.json', orient='records', indent=2)
+            print(f"Data saved to data/{filename}.json")
+
+
+class TumblrScraper(BaseScraper):
     def __init__(self, headless=True):
         """Initialize the scraper with Chrome driver"""
+        super().__init__()
+        self.headless = headless
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 10)
-        self.data = []
         
     def scroll_page(self, scrolls=3):
         """Scroll the page to load dynamic content"""
         for i in range(scrolls):
+            prev_height = self.driver.execute_script("return document.body.scrollHeight")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: d.execute_script("return document.body.scrollHeight") > prev_height
+                )
+            except TimeoutException:
+                print(f"No new content after scroll {i+1}, stopping")
+                break
             print(f"Scroll {i+1}/{scrolls} completed")
     
     def extract_post_data(self, post_element):
@@ -99,47 +142,60 @@ class TumblrScraper:
         try:
             print(f"Navigating to {blog_url}")
             self.driver.get(blog_url)
-            time.sleep(3)
+            # get() already waits for the load event; posts are rendered by JS after it
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, POST_SELECTOR)))
+            except TimeoutException:
+                print(f"No posts found on {blog_url}")
+                return
             
             self.scroll_page(num_scrolls)
             
             print("Extracting posts...")
-            post_elements = self.driver.find_elements(By.CSS_SELECTOR, "article, div[class*='post'], .post")
+            post_elements = self.driver.find_elements(By.CSS_SELECTOR, POST_SELECTOR)
             print(f"Found {len(post_elements)} post elements")
             
+            posts = []
             for idx, post in enumerate(post_elements):
                 print(f"Processing post {idx+1}/{len(post_elements)}")
                 post_data = self.extract_post_data(post)
                 if post_data:  
-                    self.data.append(post_data)
+                    posts.append(post_data)
+            self.data.extend(posts)
             
-            print(f"Successfully extracted {len(self.data)} posts from {blog_url}")
+            print(f"Successfully extracted {len(posts)} posts from {blog_url}")
             
         except Exception as e:
             print(f"Error scraping blog {blog_url}: {e}")
     
-    def scrape_multiple_blogs(self, blog_urls, posts_per_blog=5):
-        """Scrape multiple Tumblr blogs"""
-        for blog_url in blog_urls:
-            self.scrape_blog(blog_url, num_scrolls=posts_per_blog)
-            time.sleep(3)  #delay betwen logs
-    
-    def save_data(self, filename='tumblr_data', format='both'):
-        """Save the collected data to the data folder"""
-        os.makedirs('data', exist_ok=True)
-        df = pd.DataFrame(self.data)
+    def scrape_multiple_blogs(self, blog_urls, posts_per_blog=5, max_workers=4):
+        """Scrape multiple Tumblr blogs concurrently, one browser per worker"""
+        num_workers = max(1, min(max_workers, len(blog_urls)))
+        extra_scrapers = []
         
-        if df.empty:
-            print("No data to save")
-            return
+        # each browser is checked out by one thread at a time
+        idle_scrapers = queue.Queue()
+        idle_scrapers.put(self)
         
-        if format in ['csv', 'both']:
-            df.to_csv(f'data/{filename}.csv', index=False)
-            print(f"Data saved to data/{filename}.csv")
+        def scrape_one(blog_url):
+            scraper = idle_scrapers.get()
+            try:
+                scraper.scrape_blog(blog_url, num_scrolls=posts_per_blog)
+            finally:
+                idle_scrapers.put(scraper)
         
-        if format in ['json', 'both']:
-            df.to_json(f'data/{filename}.json', orient='records', indent=2)
-            print(f"Data saved to data/{filename}.json")
+        try:
+            # started one at a time so a failed launch still closes the earlier ones
+            for _ in range(num_workers - 1):
+                extra_scrapers.append(TumblrScraper(headless=self.headless))
+                idle_scrapers.put(extra_scrapers[-1])
+            
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                list(executor.map(scrape_one, blog_urls))
+        finally:
+            for scraper in extra_scrapers:
+                self.data.extend(scraper.data)
+                scraper.close()
     
     def close(self):
         """Close the browser"""
@@ -147,6 +203,105 @@ class TumblrScraper:
         print("Browser closed")
 
 
+class AsyncTumblrScraper(BaseScraper):
+    """Scraper for server-rendered blogs: async HTTP fetch plus C-level HTML parsing"""
+    
+    def __init__(self, timeout=10):
+        """Initialize the scraper settings"""
+        super().__init__()
+        self.timeout = timeout
+    
+    def extract_post_data(self, post_node, page_url):
+        """Extract data from a single parsed post node"""
+        try:
+            post_data = {
+                'timestamp': datetime.now().isoformat(),
+                'post_text': '',
+                'post_type': '',
+                'notes_count': 0,
+                'tags': [],
+                'image_url': '',
+                'post_url': ''
+            }
+            
+            text_node = post_node.css_first("div[class*='post-body'], div[class*='caption']")
+            if text_node is not None:
+                post_data['post_text'] = text_node.text(separator=' ', strip=True)
+            
+            if post_node.css_first("img, figure") is not None:
+                post_data['post_type'] = 'photo'
+            elif post_node.css_first("blockquote") is not None:
+                post_data['post_type'] = 'quote'
+            else:
+                post_data['post_type'] = 'text'
+            
+            notes_node = post_node.css_first("a[class*='note-count'], span[class*='note']")
+            if notes_node is not None:
+                notes_num = ''.join(filter(str.isdigit, notes_node.text()))
+                post_data['notes_count'] = int(notes_num) if notes_num else 0
+            
+            tag_texts = (tag.text(strip=True) for tag in post_node.css("a[class*='tag'], .tags a"))
+            post_data['tags'] = [text.strip('#') for text in tag_texts if text]
+            
+            img_node = post_node.css_first("img")
+            if img_node is not None and img_node.attributes.get('src'):
+                post_data['image_url'] = urljoin(page_url, img_node.attributes['src'])
+            
+            link_node = post_node.css_first("a[class*='permalink'], a.timestamp")
+            if link_node is not None and link_node.attributes.get('href'):
+                post_data['post_url'] = urljoin(page_url, link_node.attributes['href'])
+            
+            return post_data
+            
+        except Exception as e:
+            print(f"Error extracting post data: {e}")
+            return None
+    
+    async def fetch_pages(self, blog_urls):
+        """Fetch all blog pages concurrently over one HTTP/2 client"""
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={'user-agent': USER_AGENT},
+        ) as client:
+            return await asyncio.gather(
+                *[client.get(url) for url in blog_urls],
+                return_exceptions=True
+            )
+    
+    def scrape_multiple_blogs(self, blog_urls):
+        """Scrape multiple blogs and return the ones that need a browser"""
+        responses = asyncio.run(self.fetch_pages(blog_urls))
+        
+        needs_browser = []
+        for blog_url, response in zip(blog_urls, responses):
+            if isinstance(response, Exception):
+                print(f"Error fetching blog {blog_url}: {response}")
+                needs_browser.append(blog_url)
+                continue
+            if not response.is_success:
+                print(f"Error fetching blog {blog_url}: HTTP {response.status_code}")
+                needs_browser.append(blog_url)
+                continue
+            
+            post_nodes = LexborHTMLParser(response.text).css(POST_SELECTOR)
+            print(f"Found {len(post_nodes)} post elements on {blog_url}")
+            
+            # no posts in the static HTML means the page is rendered by JavaScript
+            if not post_nodes:
+                needs_browser.append(blog_url)
+                continue
+            
+            for post in post_nodes:
+                post_data = self.extract_post_data(post, str(response.url))
+                if post_data:
+                    self.data.append(post_data)
+        
+        print(f"Successfully extracted {len(self.data)} posts over HTTP")
+        return needs_browser
+
+
 def main():
     """Main execution function"""
     
@@ -158,11 +313,20 @@ def main():
         'https://www.tumblr.com/tagged/coding',
     ]
     
+    print("Fetching server-rendered blogs...")
+    fast_scraper = AsyncTumblrScraper()
+    remaining = fast_scraper.scrape_multiple_blogs(blogs_to_scrape)
+    
+    if not remaining:
+        fast_scraper.save_data('tumblr_posts', format='both')
+        return
+    
     print("Initializing Tumblr scraper...")
     scraper = TumblrScraper(headless=False)
+    scraper.data = fast_scraper.data
     
     try:
-        scraper.scrape_multiple_blogs(blogs_to_scrape, posts_per_blog=3)
+        scraper.scrape_multiple_blogs(remaining, posts_per_blog=3)
         scraper.save_data('tumblr_posts', format='both')
     except Exception as e:
         print(f"Error during scraping: {e}")